@@ -41,7 +41,6 @@ __all__: typing.List[str] = [
     "GuildVoiceChannel",
 ]
 
-import abc
 import typing
 
 import attr
@@ -294,7 +293,7 @@ class PartialChannel(snowflakes.Unique):
         return self.name if self.name is not None else f"Unnamed {self.__class__.__name__} ID {self.id}"
 
 
-class TextChannel(PartialChannel, abc.ABC):
+class TextChannel(PartialChannel):
     """A channel that can have text messages in it."""
 
     # This is a mixin, do not add slotted fields.
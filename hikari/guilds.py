@@ -410,18 +410,14 @@ class Member(users.User):
             the highest role the user has.
         """
         roles_view = self.app.cache.get_roles_view_for_guild(self.guild_id)
+        role_ids = frozenset(self.role_ids)
 
-        roles = sorted(
-            (r for r in roles_view.values() if r.id in self.role_ids),
+        return max(
+            (r for r in roles_view.values() if r.id in role_ids),
             key=lambda r: r.position,
-            reverse=True,
+            default=None,
         )
 
-        try:
-            return next(iter(roles))
-        except StopIteration:
-            return None
-
     @property
     def username(self) -> str:
         return self.user.username
@@ -26,6 +26,7 @@ from __future__ import annotations
 __all__: typing.List[str] = ["EntityFactoryImpl"]
 
 import datetime
+import sys
 import typing
 
 import attr
@@ -224,16 +225,17 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             audit_log_models.AuditLogEventType.MEMBER_DISCONNECT: self._deserialize_member_disconnect_entry_info,
             audit_log_models.AuditLogEventType.MEMBER_MOVE: self._deserialize_member_move_entry_info,
         }
+        # These are keyed by the raw integer values which payloads carry.
         self._dm_channel_type_mapping = {
-            channel_models.ChannelType.DM: self.deserialize_dm,
-            channel_models.ChannelType.GROUP_DM: self.deserialize_group_dm,
+            channel_models.ChannelType.DM.value: self.deserialize_dm,
+            channel_models.ChannelType.GROUP_DM.value: self.deserialize_group_dm,
         }
         self._guild_channel_type_mapping = {
-            channel_models.ChannelType.GUILD_CATEGORY: self.deserialize_guild_category,
-            channel_models.ChannelType.GUILD_TEXT: self.deserialize_guild_text_channel,
-            channel_models.ChannelType.GUILD_NEWS: self.deserialize_guild_news_channel,
-            channel_models.ChannelType.GUILD_STORE: self.deserialize_guild_store_channel,
-            channel_models.ChannelType.GUILD_VOICE: self.deserialize_guild_voice_channel,
+            channel_models.ChannelType.GUILD_CATEGORY.value: self.deserialize_guild_category,
+            channel_models.ChannelType.GUILD_TEXT.value: self.deserialize_guild_text_channel,
+            channel_models.ChannelType.GUILD_NEWS.value: self.deserialize_guild_news_channel,
+            channel_models.ChannelType.GUILD_STORE.value: self.deserialize_guild_store_channel,
+            channel_models.ChannelType.GUILD_VOICE.value: self.deserialize_guild_voice_channel,
         }
 
     ######################
@@ -332,10 +334,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
     def _deserialize_audit_log_overwrites(
         self, payload: data_binding.JSONArray
     ) -> typing.Mapping[snowflakes.Snowflake, channel_models.PermissionOverwrite]:
-        return {
-            snowflakes.Snowflake(overwrite["id"]): self.deserialize_permission_overwrite(overwrite)
-            for overwrite in payload
-        }
+        return {overwrite.id: overwrite for overwrite in map(self.deserialize_permission_overwrite, payload)}
 
     def _deserialize_channel_overwrite_entry_info(
         self,
@@ -519,7 +518,11 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         else:
             nicknames = {}
 
-        recipients = {snowflakes.Snowflake(user["id"]): self.deserialize_user(user) for user in payload["recipients"]}
+        recipients = {user.id: user for user in map(self.deserialize_user, payload["recipients"])}
+
+        application_id: typing.Optional[snowflakes.Snowflake] = None
+        if (raw_application_id := payload.get("application_id")) is not None:
+            application_id = snowflakes.Snowflake(raw_application_id)
 
         return channel_models.GroupDMChannel(
             app=self._app,
@@ -530,7 +533,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             owner_id=snowflakes.Snowflake(payload["owner_id"]),
             icon_hash=payload["icon"],
             nicknames=nicknames,
-            application_id=snowflakes.Snowflake(payload["application_id"]) if "application_id" in payload else None,
+            application_id=application_id,
             recipients=recipients,
         )
 
@@ -544,8 +547,8 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             guild_id = snowflakes.Snowflake(payload["guild_id"])
 
         permission_overwrites = {
-            snowflakes.Snowflake(overwrite["id"]): self.deserialize_permission_overwrite(overwrite)
-            for overwrite in payload["permission_overwrites"]
+            overwrite.id: overwrite
+            for overwrite in map(self.deserialize_permission_overwrite, payload.get("permission_overwrites", ()))
         }  # TODO: while snowflakes are guaranteed to be unique within their own resource, there is no guarantee for
         # across between resources (user and role in this case); while in practice we will not get overlap there is a
         # chance that this may happen in the future, would it be more sensible to use a Sequence here?
@@ -554,9 +557,14 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         if (raw_parent_id := payload.get("parent_id")) is not None:
             parent_id = snowflakes.Snowflake(raw_parent_id)
 
+        # Channel names such as "general" are repeated across most guilds, so
+        # interning them saves holding thousands of equal strings in the cache.
+        if (name := payload.get("name")) is not None:
+            name = sys.intern(name)
+
         return _GuildChannelFields(
             id=snowflakes.Snowflake(payload["id"]),
-            name=payload.get("name"),
+            name=name,
             type=channel_models.ChannelType(payload["type"]),
             guild_id=guild_id,
             position=int(payload["position"]),
@@ -919,7 +927,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
     def deserialize_known_custom_emoji(
         self, payload: data_binding.JSONObject, *, guild_id: snowflakes.Snowflake
     ) -> emoji_models.KnownCustomEmoji:
-        role_ids = [snowflakes.Snowflake(role_id) for role_id in payload["roles"]] if "roles" in payload else []
+        role_ids = list(map(snowflakes.Snowflake, payload["roles"])) if "roles" in payload else []
 
         user: typing.Optional[user_models.User] = None
         if (raw_user := payload.get("user")) is not None:
@@ -990,7 +998,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         if guild_id is undefined.UNDEFINED:
             guild_id = snowflakes.Snowflake(payload["guild_id"])
 
-        role_ids = [snowflakes.Snowflake(role_id) for role_id in payload["roles"]]
+        role_ids = list(map(snowflakes.Snowflake, payload["roles"]))
         # If Discord ever does start including this here without warning we don't want to duplicate the entry.
         if guild_id not in role_ids:
             role_ids.append(guild_id)
@@ -1134,8 +1142,11 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
     def deserialize_guild_preview(self, payload: data_binding.JSONObject) -> guild_models.GuildPreview:
         guild_fields = self._set_partial_guild_attributes(payload)
         emojis = {
-            snowflakes.Snowflake(emoji["id"]): self.deserialize_known_custom_emoji(emoji, guild_id=guild_fields.id)
-            for emoji in payload["emojis"]
+            emoji.id: emoji
+            for emoji in (
+                self.deserialize_known_custom_emoji(emoji_payload, guild_id=guild_fields.id)
+                for emoji_payload in payload["emojis"]
+            )
         }
         return guild_models.GuildPreview(
             app=self._app,
@@ -1215,12 +1226,19 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             max_presences = int(raw_max_presences)
 
         roles = {
-            snowflakes.Snowflake(role["id"]): self.deserialize_role(role, guild_id=guild_fields.id)
-            for role in payload["roles"]
+            role.id: role
+            for role in (
+                self.deserialize_role(role_payload, guild_id=guild_fields.id)
+                for role_payload in payload["roles"]
+            )
         }
+
         emojis = {
-            snowflakes.Snowflake(emoji["id"]): self.deserialize_known_custom_emoji(emoji, guild_id=guild_fields.id)
-            for emoji in payload["emojis"]
+            emoji.id: emoji
+            for emoji in (
+                self.deserialize_known_custom_emoji(emoji_payload, guild_id=guild_fields.id)
+                for emoji_payload in payload["emojis"]
+            )
         }
         guild = guild_models.RESTGuild(
             app=self._app,
@@ -1302,49 +1320,61 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             member_count=member_count,
         )
 
+        # The member, channel, presence and voice state lists can hold thousands of entries for large guilds,
+        # so their deserializers and the guild ID are bound to locals ahead of the loops.
+        guild_id = guild.id
+
         members: typing.Optional[typing.MutableMapping[snowflakes.Snowflake, guild_models.Member]] = None
-        if "members" in payload:
+        if (raw_members := payload.get("members")) is not None:
             members = {}
+            deserialize_member = self.deserialize_member
 
-            for member_payload in payload["members"]:
-                member = self.deserialize_member(member_payload, guild_id=guild.id)
+            for member_payload in raw_members:
+                member = deserialize_member(member_payload, guild_id=guild_id)
                 members[member.user.id] = member
 
         channels: typing.Optional[typing.MutableMapping[snowflakes.Snowflake, channel_models.GuildChannel]] = None
-        if "channels" in payload:
+        if (raw_channels := payload.get("channels")) is not None:
             channels = {}
+            # Everything in a guild's channel list is a guild channel, so this dispatches on the raw type straight
+            # away rather than going through deserialize_channel's private channel fallback for each one.
+            guild_channel_type_mapping = self._guild_channel_type_mapping
 
-            for channel_payload in payload["channels"]:
-                channel = typing.cast(
-                    "channel_models.GuildChannel", self.deserialize_channel(channel_payload, guild_id=guild.id)
-                )
+            for channel_payload in raw_channels:
+                channel = guild_channel_type_mapping[channel_payload["type"]](channel_payload, guild_id=guild_id)
                 channels[channel.id] = channel
 
         presences: typing.Optional[typing.MutableMapping[snowflakes.Snowflake, presence_models.MemberPresence]] = None
-        if "presences" in payload:
+        if (raw_presences := payload.get("presences")) is not None:
             presences = {}
+            deserialize_member_presence = self.deserialize_member_presence
 
-            for presence_payload in payload["presences"]:
-                presence = self.deserialize_member_presence(presence_payload, guild_id=guild.id)
+            for presence_payload in raw_presences:
+                presence = deserialize_member_presence(presence_payload, guild_id=guild_id)
                 presences[presence.user_id] = presence
 
         voice_states: typing.Optional[typing.MutableMapping[snowflakes.Snowflake, voice_models.VoiceState]] = None
-        if "voice_states" in payload:
+        if (raw_voice_states := payload.get("voice_states")) is not None:
             voice_states = {}
             assert members is not None
+            deserialize_voice_state = self.deserialize_voice_state
 
-            for voice_state_payload in payload["voice_states"]:
+            for voice_state_payload in raw_voice_states:
                 member = members[snowflakes.Snowflake(voice_state_payload["user_id"])]
-                voice_state = self.deserialize_voice_state(voice_state_payload, guild_id=guild.id, member=member)
+                voice_state = deserialize_voice_state(voice_state_payload, guild_id=guild_id, member=member)
                 voice_states[voice_state.user_id] = voice_state
 
         roles = {
-            snowflakes.Snowflake(role["id"]): self.deserialize_role(role, guild_id=guild.id)
-            for role in payload["roles"]
+            role.id: role
+            for role in (self.deserialize_role(role_payload, guild_id=guild_id) for role_payload in payload["roles"])
         }
+
         emojis = {
-            snowflakes.Snowflake(emoji["id"]): self.deserialize_known_custom_emoji(emoji, guild_id=guild.id)
-            for emoji in payload["emojis"]
+            emoji.id: emoji
+            for emoji in (
+                self.deserialize_known_custom_emoji(emoji_payload, guild_id=guild_id)
+                for emoji_payload in payload["emojis"]
+            )
         }
 
         return entity_factory.GatewayGuildDefinition(guild, channels, members, presences, roles, emojis, voice_states)
@@ -1481,7 +1511,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
 
         role_mentions: undefined.UndefinedOr[typing.Sequence[snowflakes.Snowflake]] = undefined.UNDEFINED
         if "mention_roles" in payload:
-            role_mentions = [snowflakes.Snowflake(mention) for mention in payload["mention_roles"]]
+            role_mentions = list(map(snowflakes.Snowflake, payload["mention_roles"]))
 
         channel_mentions: undefined.UndefinedOr[typing.Sequence[snowflakes.Snowflake]] = undefined.UNDEFINED
         if "mention_channels" in payload:
@@ -1596,7 +1626,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             edited_timestamp = time.iso8601_datetime_string_to_datetime(raw_edited_timestamp)
 
         user_mentions = [snowflakes.Snowflake(mention["id"]) for mention in payload["mentions"]]
-        role_mentions = [snowflakes.Snowflake(mention) for mention in payload["mention_roles"]]
+        role_mentions = list(map(snowflakes.Snowflake, payload["mention_roles"]))
         channel_mentions = (
             [snowflakes.Snowflake(mention["id"]) for mention in payload["mention_channels"]]
             if "mention_channels" in payload
@@ -1826,9 +1856,6 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
 
     def deserialize_user(self, payload: data_binding.JSONObject) -> user_models.User:
         user_fields = self._set_user_attributes(payload)
-        flags = (
-            user_models.UserFlag(payload["public_flags"]) if "public_flags" in payload else user_models.UserFlag.NONE
-        )
         return user_models.UserImpl(
             app=self._app,
             id=user_fields.id,
@@ -1837,7 +1864,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             avatar_hash=user_fields.avatar_hash,
             is_bot=user_fields.is_bot,
             is_system=user_fields.is_system,
-            flags=flags,
+            flags=user_models.UserFlag(payload.get("public_flags", user_models.UserFlag.NONE)),
         )
 
     def deserialize_my_user(self, payload: data_binding.JSONObject) -> user_models.OwnUser:
@@ -54,6 +54,15 @@ from hikari.internal import collections
 from hikari.internal import data_binding
 from hikari.internal import time
 
+_DM_CHANNEL_TYPES: typing.Final[typing.FrozenSet[int]] = frozenset(
+    (channel_models.ChannelType.DM.value, channel_models.ChannelType.GROUP_DM.value)
+)
+"""Raw channel type values which represent private channels.
+
+These are stored as plain integers so checking a raw payload's type against
+them doesn't go through the enum's comparison logic.
+"""
+
 
 class EventFactoryImpl(event_factory.EventFactory):
     """Implementation for a single-application bot event factory."""
@@ -68,31 +77,34 @@ class EventFactoryImpl(event_factory.EventFactory):
     def deserialize_channel_create_event(
         self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
     ) -> channel_events.ChannelCreateEvent:
+        if payload["type"] in _DM_CHANNEL_TYPES:
+            raise NotImplementedError("DM channel create events are undoumcneted behaviour")
+
         channel = self._app.entity_factory.deserialize_channel(payload)
         if isinstance(channel, channel_models.GuildChannel):
             return channel_events.GuildChannelCreateEvent(app=self._app, shard=shard, channel=channel)
-        if isinstance(channel, channel_models.PrivateChannel):
-            raise NotImplementedError("DM channel create events are undoumcneted behaviour")
         raise TypeError(f"Expected GuildChannel or PrivateChannel but received {type(channel).__name__}")
 
     def deserialize_channel_update_event(
         self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject, old_channel: typing.Optional[channel_models.GuildChannel] = None
     ) -> channel_events.ChannelUpdateEvent:
+        if payload["type"] in _DM_CHANNEL_TYPES:
+            raise NotImplementedError("DM channel update events are undocumented behaviour")
+
         channel = self._app.entity_factory.deserialize_channel(payload)
         if isinstance(channel, channel_models.GuildChannel):
             return channel_events.GuildChannelUpdateEvent(app=self._app, shard=shard, channel=channel, old_channel=old_channel)
-        if isinstance(channel, channel_models.PrivateChannel):
-            raise NotImplementedError("DM channel update events are undocumented behaviour")
         raise TypeError(f"Expected GuildChannel or PrivateChannel but received {type(channel).__name__}")
 
     def deserialize_channel_delete_event(
         self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
     ) -> channel_events.ChannelDeleteEvent:
+        if payload["type"] in _DM_CHANNEL_TYPES:
+            raise NotImplementedError("DM channel delete events are undocumented behaviour")
+
         channel = self._app.entity_factory.deserialize_channel(payload)
         if isinstance(channel, channel_models.GuildChannel):
             return channel_events.GuildChannelDeleteEvent(app=self._app, shard=shard, channel=channel)
-        if isinstance(channel, channel_models.PrivateChannel):
-            raise NotImplementedError("DM channel delete events are undocumented behaviour")
         raise TypeError(f"Expected GuildChannel or PrivateChannel but received {type(channel).__name__}")
 
     def deserialize_channel_pins_update_event(
@@ -413,7 +425,7 @@ class EventFactoryImpl(event_factory.EventFactory):
         self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
     ) -> message_events.MessageDeleteEvent:
 
-        message_ids = collections.SnowflakeSet(*(snowflakes.Snowflake(message_id) for message_id in payload["ids"]))
+        message_ids = collections.SnowflakeSet(*map(snowflakes.Snowflake, payload["ids"]))
         channel_id = snowflakes.Snowflake(payload["channel_id"])
 
         if "guild_id" in payload:
@@ -573,7 +585,7 @@ class EventFactoryImpl(event_factory.EventFactory):
             for m in payload["members"]
         }
         # Note, these IDs may be returned as ints or strings based on whether they're over a certain value.
-        not_found = [snowflakes.Snowflake(sn) for sn in payload["not_found"]] if "not_found" in payload else []
+        not_found = list(map(snowflakes.Snowflake, payload["not_found"])) if "not_found" in payload else []
 
         nonce = typing.cast("typing.Optional[str]", payload.get("nonce"))
 
@@ -98,7 +98,6 @@ class StatefulCacheImpl(cache.MutableCache):
         "_unknown_custom_emoji_entries",
         "_user_entries",
         "_message_entries",
-        "max_messages"
     )
 
     # For the sake of keeping things clean, the annotations are being kept separate from the assignment here.
@@ -114,9 +113,8 @@ class StatefulCacheImpl(cache.MutableCache):
         cache_utility.GenericRefWrapper[emojis.CustomEmoji],
     ]
     _user_entries: collections.ExtendedMutableMapping[snowflakes.Snowflake, cache_utility.GenericRefWrapper[users.User]]
-    _message_entries: collections.ExtendedMutableMapping[snowflakes.Snowflake, messages.PartialMessage]
+    _message_entries: collections.LimitedCapacityCacheMap[snowflakes.Snowflake, messages.PartialMessage]
     _intents: intents_.Intents
-    max_messages: int
 
     def __init__(self, app: traits.RESTAware, intents: intents_.Intents, max_messages: int) -> None:
         self._app = app
@@ -130,9 +128,18 @@ class StatefulCacheImpl(cache.MutableCache):
         # found attached to cached presence activities.
         self._unknown_custom_emoji_entries = collections.FreezableDict()
         self._user_entries = collections.FreezableDict()
-        self._message_entries = collections.FreezableDict()
+        # This drops the oldest inserted messages itself once max_messages is exceeded.
+        self._message_entries = collections.LimitedCapacityCacheMap(limit=max_messages)
         self._intents = intents
-        self.max_messages = max_messages
+
+    @property
+    def max_messages(self) -> int:
+        """Maximum number of messages to keep cached before removing the oldest ones."""
+        return self._message_entries.limit
+
+    @max_messages.setter
+    def max_messages(self, max_messages: int) -> None:
+        self._message_entries.limit = max_messages
 
     def _assert_has_intent(self, intents: intents_.Intents, /) -> None:
         if self._intents ^ intents:
@@ -156,9 +163,6 @@ class StatefulCacheImpl(cache.MutableCache):
 
         return emoji_data.build_entity(app=self._app, user=user)
 
-    def _increment_emoji_ref_count(self, emoji_id: snowflakes.Snowflake, increment: int = 1) -> None:
-        self._emoji_entries[emoji_id].ref_count += increment
-
     def _garbage_collect_emoji(self, emoji_id: snowflakes.Snowflake, decrement: int = 0) -> None:
         emoji_data = self._emoji_entries.get(emoji_id)
 
@@ -227,30 +231,35 @@ class StatefulCacheImpl(cache.MutableCache):
         return self._clear_emojis(guild_id)
 
     def delete_emoji(self, emoji_id: snowflakes.Snowflake, /) -> typing.Optional[emojis.KnownCustomEmoji]:
-        emoji_data = self._emoji_entries.pop(emoji_id, None)
+        emoji_data = self._emoji_entries.get(emoji_id)
         if emoji_data is None:
             return None
 
         emoji_data.has_been_deleted = True
+        guild_record = self._guild_entries.get(emoji_data.guild_id)
+        if guild_record and guild_record.emojis:  # TODO: should this make assumptions and be flat?
+            guild_record.emojis.remove(emoji_id)
+
+            if not guild_record.emojis:
+                guild_record.emojis = None
+                self._remove_guild_record_if_empty(emoji_data.guild_id)
+
+        # Emojis which are still referenced by a cached presence are kept (as `_clear_emojis` does) until they're
+        # garbage collected by the last presence which references them.
         if not self._can_remove_emoji(emoji_data):
             return None
 
+        del self._emoji_entries[emoji_id]
         emoji = self._build_emoji(emoji_data)
 
         if emoji_data.user_id is not None:
             self._garbage_collect_user(emoji_data.user_id, decrement=1)
 
-        guild_record = self._guild_entries.get(emoji_data.guild_id)
-        if guild_record and guild_record.emojis:  # TODO: should this make assumptions and be flat?
-            guild_record.emojis.remove(emoji_id)
-
-            if not guild_record.emojis:
-                guild_record.emojis = None
-
         return emoji
 
     def get_emoji(self, emoji_id: snowflakes.Snowflake, /) -> typing.Optional[emojis.KnownCustomEmoji]:
-        return self._build_emoji(self._emoji_entries[emoji_id]) if emoji_id in self._emoji_entries else None
+        emoji_data = self._emoji_entries.get(emoji_id)
+        return self._build_emoji(emoji_data) if emoji_data is not None else None
 
     def _get_emojis_view(  # TODO: split out the two cases (specific guild vs global)
         self, guild_id: undefined.UndefinedOr[snowflakes.Snowflake] = undefined.UNDEFINED
@@ -288,12 +297,20 @@ class StatefulCacheImpl(cache.MutableCache):
         return self._get_emojis_view(guild_id=guild_id)
 
     def set_emoji(self, emoji: emojis.KnownCustomEmoji, /) -> None:
+        cached_emoji_data = self._emoji_entries.get(emoji.id)
+        # The user is only included when we have MANAGE_EMOJIS, so an overwritten emoji may gain, lose or change it.
+        old_user_id = cached_emoji_data.user_id if cached_emoji_data is not None else None
+        new_user_id = emoji.user.id if emoji.user is not None else None
+
         if emoji.user is not None:
             self.set_user(emoji.user)
-            if emoji.id not in self._emoji_entries:
+            if new_user_id != old_user_id:
                 self._increment_user_ref_count(emoji.user.id)
 
         self._emoji_entries[emoji.id] = cache_utility.KnownCustomEmojiData.build_from_entity(emoji)
+
+        if old_user_id is not None and old_user_id != new_user_id:
+            self._garbage_collect_user(old_user_id, decrement=1)
         guild_container = self._get_or_create_guild_record(emoji.guild_id)
 
         if guild_container.emojis is None:  # TODO: add test cases when it is not None?
@@ -309,14 +326,17 @@ class StatefulCacheImpl(cache.MutableCache):
         return cached_emoji, self.get_emoji(emoji.id)
 
     def _remove_guild_record_if_empty(self, guild_id: snowflakes.Snowflake) -> None:
-        if guild_id in self._guild_entries and not self._guild_entries[guild_id]:
+        guild_record = self._guild_entries.get(guild_id)
+        if guild_record is not None and not guild_record:
             del self._guild_entries[guild_id]
 
     def _get_or_create_guild_record(self, guild_id: snowflakes.Snowflake) -> cache_utility.GuildRecord:
-        if guild_id not in self._guild_entries:
-            self._guild_entries[guild_id] = cache_utility.GuildRecord()
+        guild_record = self._guild_entries.get(guild_id)
+        if guild_record is None:
+            guild_record = cache_utility.GuildRecord()
+            self._guild_entries[guild_id] = guild_record
 
-        return self._guild_entries[guild_id]
+        return guild_record
 
     def clear_guilds(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
         cached_guilds = {}
@@ -335,10 +355,10 @@ class StatefulCacheImpl(cache.MutableCache):
         )
 
     def delete_guild(self, guild_id: snowflakes.Snowflake, /) -> typing.Optional[guilds.GatewayGuild]:
-        if guild_id not in self._guild_entries:
+        guild_record = self._guild_entries.get(guild_id)
+        if guild_record is None:
             return None
 
-        guild_record = self._guild_entries[guild_id]
         guild = guild_record.guild
 
         if guild is not None:
@@ -358,9 +378,11 @@ class StatefulCacheImpl(cache.MutableCache):
         return copy.copy(guild_record.guild)
 
     def get_guild(self, guild_id: snowflakes.Snowflake, /) -> typing.Optional[guilds.GatewayGuild]:
-        if (guild := self._get_guild(guild_id, availability=True)) is not None:
-            return guild
-        return self._get_guild(guild_id, availability=False)
+        guild_record = self._guild_entries.get(guild_id)
+        if guild_record is None or guild_record.guild is None or guild_record.is_available is None:
+            return None
+
+        return copy.copy(guild_record.guild)
 
     def get_available_guild(self, guild_id: snowflakes.Snowflake, /) -> typing.Optional[guilds.GatewayGuild]:
         return self._get_guild(guild_id, availability=True)
@@ -400,8 +422,8 @@ class StatefulCacheImpl(cache.MutableCache):
         self, guild: guilds.GatewayGuild, /
     ) -> typing.Tuple[typing.Optional[guilds.GatewayGuild], typing.Optional[guilds.GatewayGuild]]:
         guild = copy.copy(guild)
-        guild_record = self._guild_entries.get(guild.id)
-        cached_guild = guild_record.guild if guild_record is not None else None
+        guild_record = self._get_or_create_guild_record(guild.id)
+        cached_guild = guild_record.guild
 
         # We have to manually update these because inconsistency by Discord.
         if cached_guild is not None:
@@ -409,9 +431,9 @@ class StatefulCacheImpl(cache.MutableCache):
             guild.joined_at = cached_guild.joined_at
             guild.is_large = cached_guild.is_large
 
-        self.set_guild(guild)
-        guild_record = self._guild_entries.get(guild.id)
-        return cached_guild, guild_record.guild if guild_record is not None else None
+        guild_record.guild = guild
+        guild_record.is_available = True
+        return cached_guild, guild
 
     def clear_guild_channels(self) -> cache.CacheView[snowflakes.Snowflake, channels.GuildChannel]:
         cached_channels = self._guild_channel_entries
@@ -433,7 +455,8 @@ class StatefulCacheImpl(cache.MutableCache):
 
         # Tuple casts like this avoid edge case issues which would be caused by guild_record.channels being modified
         # while we're iterating over it
-        cached_channels = {sf: self._guild_channel_entries.pop(sf) for sf in tuple(guild_record.channels)}
+        channel_entries = self._guild_channel_entries
+        cached_channels = {sf: channel_entries.pop(sf) for sf in tuple(guild_record.channels)}
         guild_record.channels = None
         self._remove_guild_record_if_empty(guild_id)
         return cache_utility.StatefulCacheMappingView(cached_channels)
@@ -470,16 +493,20 @@ class StatefulCacheImpl(cache.MutableCache):
 
         # Tuple casts like this avoids edge case issues which would be caused by arrays being modified while we're
         # iterating over them.
-        cached_channels = {sf: self._guild_channel_entries[sf] for sf in tuple(guild_record.channels)}
+        channel_entries = self._guild_channel_entries
+        cached_channels = {sf: channel_entries[sf] for sf in tuple(guild_record.channels)}
 
         def sorter(args: typing.Tuple[snowflakes.Snowflake, channels.GuildChannel]) -> typing.Tuple[int, int, int]:
             channel = args[1]
-            if isinstance(channel, channels.GuildCategory):
+            if channel.type == channels.ChannelType.GUILD_CATEGORY:
                 return channel.position, -1, 0
 
-            parent_position = -1 if channel.parent_id is None else cached_channels[channel.parent_id].position
+            # A single lookup covers both the channel not having a parent and the
+            # parent category not being cached (e.g. it was deleted first).
+            parent = cached_channels.get(channel.parent_id) if channel.parent_id is not None else None
+            parent_position = -1 if parent is None else parent.position
 
-            if not isinstance(channel, channels.GuildVoiceChannel):
+            if channel.type != channels.ChannelType.GUILD_VOICE:
                 return parent_position, 0, channel.position
 
             return parent_position, 1, channel.position
@@ -499,7 +526,7 @@ class StatefulCacheImpl(cache.MutableCache):
     def update_guild_channel(
         self, channel: channels.GuildChannel, /
     ) -> typing.Tuple[typing.Optional[channels.GuildChannel], typing.Optional[channels.GuildChannel]]:
-        cached_channel = self.get_guild_channel(channel.id)
+        cached_channel = self._guild_channel_entries.get(channel.id)
         self.set_guild_channel(channel)
         return cached_channel, self.get_guild_channel(channel.id)
 
@@ -609,10 +636,11 @@ class StatefulCacheImpl(cache.MutableCache):
         )
 
     def delete_invite(self, code: str, /) -> typing.Optional[invites.InviteWithMetadata]:
-        if code not in self._invite_entries:
+        invite_data = self._invite_entries.pop(code, None)
+        if invite_data is None:
             return None
 
-        invite = self._build_invite(self._invite_entries.pop(code))
+        invite = self._build_invite(invite_data)
 
         if invite.inviter is not None:
             self._garbage_collect_user(invite.inviter.id, decrement=1)
@@ -632,7 +660,8 @@ class StatefulCacheImpl(cache.MutableCache):
         return invite
 
     def get_invite(self, code: str, /) -> typing.Optional[invites.InviteWithMetadata]:
-        return self._build_invite(self._invite_entries[code]) if code in self._invite_entries else None
+        invite_data = self._invite_entries.get(code)
+        return self._build_invite(invite_data) if invite_data is not None else None
 
     def _get_invites_view(  # TODO: split out into two separate cases (global and specific guild)
         self, guild_id: undefined.UndefinedOr[snowflakes.Snowflake] = undefined.UNDEFINED
@@ -1103,7 +1132,8 @@ class StatefulCacheImpl(cache.MutableCache):
         if guild_record is None or guild_record.presences is None:
             return None
 
-        return self._build_presence(guild_record.presences[user_id]) if user_id in guild_record.presences else None
+        presence_data = guild_record.presences.get(user_id)
+        return self._build_presence(presence_data) if presence_data is not None else None
 
     def _chainable_get_presence_assets(
         self,
@@ -1190,12 +1220,15 @@ class StatefulCacheImpl(cache.MutableCache):
             if emoji is None or not isinstance(emoji, emojis.CustomEmoji):
                 continue
 
-            if emoji.id in self._emoji_entries:
-                self._increment_emoji_ref_count(emoji.id)
+            known_emoji_data = self._emoji_entries.get(emoji.id)
+            if known_emoji_data is not None:
+                known_emoji_data.ref_count += 1
+                continue
 
-            elif emoji.id in self._unknown_custom_emoji_entries:
-                self._unknown_custom_emoji_entries[emoji.id].ref_count += 1
-                self._unknown_custom_emoji_entries[emoji.id].object = copy.copy(emoji)
+            unknown_emoji_data = self._unknown_custom_emoji_entries.get(emoji.id)
+            if unknown_emoji_data is not None:
+                unknown_emoji_data.ref_count += 1
+                unknown_emoji_data.object = copy.copy(emoji)
 
             else:
                 self._unknown_custom_emoji_entries[emoji.id] = cache_utility.GenericRefWrapper(
@@ -1302,10 +1335,14 @@ class StatefulCacheImpl(cache.MutableCache):
         self._user_entries[user_id].ref_count += increment
 
     def _garbage_collect_user(self, user_id: snowflakes.Snowflake, *, decrement: typing.Optional[int] = None) -> None:
-        if decrement is not None and user_id in self._user_entries:
-            self._increment_user_ref_count(user_id, -decrement)
+        user_data = self._user_entries.get(user_id)
+        if user_data is None:
+            return
 
-        if self._can_remove_user(self._user_entries.get(user_id)):
+        if decrement is not None:
+            user_data.ref_count -= decrement
+
+        if self._can_remove_user(user_data):
             del self._user_entries[user_id]
 
     def clear_users(self) -> cache.CacheView[snowflakes.Snowflake, users.User]:
@@ -1330,7 +1367,8 @@ class StatefulCacheImpl(cache.MutableCache):
         return None
 
     def get_user(self, user_id: snowflakes.Snowflake, /) -> typing.Optional[users.User]:
-        return copy.copy(self._user_entries[user_id].object) if user_id in self._user_entries else None
+        user_data = self._user_entries.get(user_id)
+        return copy.copy(user_data.object) if user_data is not None else None
 
     def get_users_view(self) -> cache.CacheView[snowflakes.Snowflake, users.User]:
         if not self._user_entries:
@@ -1609,25 +1647,20 @@ class StatefulCacheImpl(cache.MutableCache):
     def delete_message(
         self, message_id: snowflakes.Snowflake
     ) -> None:
-        self._message_entries.pop(message_id)
+        self._message_entries.pop(message_id, None)
 
     def delete_messages(
         self, message_ids: typing.Sequence[snowflakes.Snowflake]
     ) -> None:
         for message_id in message_ids:
-            self._message_entries.pop(message_id)
+            self._message_entries.pop(message_id, None)
 
     def get_message(
         self, message_id: snowflakes.Snowflake
     ) -> typing.Optional[messages.PartialMessage]:
         return self._message_entries.get(message_id)
 
-    def set_message(
-        self, message: messages.PartialMessage
-    ) -> None:
-        if len(self._message_entries) >= self.max_messages:
-            self._message_entries.popitem()
-            
+    def set_message(self, message: messages.PartialMessage) -> None:
         self._message_entries[message.id] = message
 
     def update_message(
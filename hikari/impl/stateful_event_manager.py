@@ -99,7 +99,8 @@ class StatefulEventManagerImpl(event_manager_base.EventManagerBase):
         old = self._cache.get_guild_channel(Snowflake(payload["id"]))
         event = self._app.event_factory.deserialize_channel_update_event(shard, payload, old)
         assert isinstance(event.channel, channels.GuildChannel), "channel update events for DM channels are unexpected"
-        self._cache.update_guild_channel(event.channel)
+        # The old channel was already fetched above.
+        self._cache.set_guild_channel(event.channel)
         await self.dispatch(event)
 
     async def on_channel_delete(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
@@ -205,7 +206,10 @@ class StatefulEventManagerImpl(event_manager_base.EventManagerBase):
         """See https://discord.com/developers/docs/topics/gateway#guild-emojis-update for more info."""
         old = self._cache.get_emojis_view_for_guild(Snowflake(payload["guild_id"]))
         event = self._app.event_factory.deserialize_guild_emojis_update_event(shard, payload, old)
-        self._cache.clear_emojis_for_guild(event.guild_id)
+
+        # Emojis which are still present in the update are overwritten in place by set_emoji.
+        for emoji_id in old.keys() - {emoji.id for emoji in event.emojis}:
+            self._cache.delete_emoji(emoji_id)
 
         for emoji in event.emojis:
             self._cache.set_emoji(emoji)
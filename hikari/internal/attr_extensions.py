@@ -183,8 +183,10 @@ def generate_deep_copier(
     if not kwargs and not setters:
         return lambda _, __: None
 
+    # `copy.deepcopy` already checks the memo for the object's id before doing
+    # anything else, so we don't duplicate that lookup in the generated code.
     setters = ";".join(
-        f"m.{attribute.name}=std_copy(m.{attribute.name},memo)if(id_:=id(m.{attribute.name}))not in memo else memo[id_]"
+        f"m.{attribute.name}=std_copy(m.{attribute.name},memo)"
         for attribute in _normalize_kwargs_and_setters(kwargs, setters)
         if not attribute.metadata.get(SKIP_DEEP_COPY)
     )
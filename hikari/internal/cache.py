@@ -566,7 +566,7 @@ class MemberPresenceData(BaseData[presences.MemberPresence]):
             user_id=entity.user_id,
             guild_id=entity.guild_id,
             visible_status=entity.visible_status,
-            activities=tuple(RichActivityData.build_from_entity(activity) for activity in entity.activities),
+            activities=tuple(map(RichActivityData.build_from_entity, entity.activities)),
             client_status=copy.copy(entity.client_status),
         )
 
@@ -658,9 +658,9 @@ def copy_guild_channel(channel: channels.GuildChannel) -> channels.GuildChannel:
     This exists account for the permission overwrite objects attached to guild
     channel objects which need to be copied themselves.
     """
-    channel = copy.copy(channel)
+    channel = attr_extensions.copy_attrs(channel)
     channel.permission_overwrites = {
-        sf: copy.copy(overwrite) for sf, overwrite in collections.copy_mapping(channel.permission_overwrites).items()
+        sf: attr_extensions.copy_attrs(overwrite) for sf, overwrite in channel.permission_overwrites.items()
     }
     return channel
 
@@ -52,6 +52,8 @@ KeyT = typing.TypeVar("KeyT", bound=typing.Hashable)
 """Type-hint A type hint used for the type of a mapping's key."""
 ValueT = typing.TypeVar("ValueT")
 """Type-hint A type hint used for the type of a mapping's value."""
+_DefaultT = typing.TypeVar("_DefaultT")
+_MISSING: typing.Final[typing.Any] = object()
 
 
 class ExtendedMutableMapping(typing.MutableMapping[KeyT, ValueT], abc.ABC):
@@ -101,10 +103,48 @@ class ExtendedMutableMapping(typing.MutableMapping[KeyT, ValueT], abc.ABC):
         """
 
 
-class FreezableDict(ExtendedMutableMapping[KeyT, ValueT]):
+class _DictBackedMapping(ExtendedMutableMapping[KeyT, ValueT], abc.ABC):
+    """Base for the mapped collections which store their entries in a `_data` dict."""
+
+    __slots__: typing.Sequence[str] = ("_data",)
+
+    _data: typing.Dict[KeyT, ValueT]
+
+    # These bypass the `MutableMapping` mixins which catch a `KeyError` on every miss.
+
+    def __contains__(self, key: typing.Any) -> bool:
+        return key in self._data
+
+    @typing.overload
+    def get(self, key: KeyT, /) -> typing.Optional[ValueT]:
+        ...
+
+    @typing.overload
+    def get(self, key: KeyT, /, default: typing.Union[ValueT, _DefaultT]) -> typing.Union[ValueT, _DefaultT]:
+        ...
+
+    def get(self, key: KeyT, /, default: typing.Any = None) -> typing.Any:
+        return self._data.get(key, default)
+
+    @typing.overload
+    def pop(self, key: KeyT, /) -> ValueT:
+        ...
+
+    @typing.overload
+    def pop(self, key: KeyT, /, default: typing.Union[ValueT, _DefaultT]) -> typing.Union[ValueT, _DefaultT]:
+        ...
+
+    def pop(self, key: KeyT, /, default: typing.Any = _MISSING) -> typing.Any:
+        if default is _MISSING:
+            return self._data.pop(key)
+
+        return self._data.pop(key, default)
+
+
+class FreezableDict(_DictBackedMapping[KeyT, ValueT]):
     """A mapping that wraps a dict, but can also be frozen."""
 
-    __slots__ = ("_data",)
+    __slots__: typing.Sequence[str] = ()
 
     def __init__(self, source: typing.Optional[typing.Dict[KeyT, ValueT]] = None, /) -> None:
         self._data = source or {}
@@ -221,7 +261,7 @@ class TimedCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
         self._garbage_collect()
 
 
-class LimitedCapacityCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
+class LimitedCapacityCacheMap(_DictBackedMapping[KeyT, ValueT]):
     """Implementation of a capacity-limited most-recently-inserted mapping.
 
     This will start removing the oldest entries after it's maximum capacity is
@@ -236,10 +276,20 @@ class LimitedCapacityCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
         A source dictionary of keys to values to create this from.
     """
 
-    __slots__ = ("_data", "_limit")
+    __slots__: typing.Sequence[str] = ("_limit",)
 
     def __init__(self, source: typing.Optional[typing.Dict[KeyT, ValueT]] = None, /, *, limit: int) -> None:
-        self._data: typing.Dict[KeyT, ValueT] = source or {}
+        self._data = source or {}
+        self._limit = limit
+        self._garbage_collect()
+
+    @property
+    def limit(self) -> int:
+        """Maximum number of entries this mapping holds before removing the oldest ones."""
+        return self._limit
+
+    @limit.setter
+    def limit(self, limit: int) -> None:
         self._limit = limit
         self._garbage_collect()
 
@@ -113,6 +113,17 @@ def mock_class_namespace(
     return type(name, (klass,), namespace)
 
 
+def assert_fully_slotted(klass):
+    """Assert that every class in the MRO declares `__slots__` with no `__dict__` or redeclared slots."""
+    slots = []
+    for base in klass.__mro__[:-1]:
+        assert "__slots__" in vars(base), f"{base.__name__} doesn't declare __slots__"
+        slots.extend(vars(base)["__slots__"])
+
+    assert "__dict__" not in slots
+    assert len(slots) == len(set(slots)), "a slot is redeclared within the class hierarchy"
+
+
 def retry(max_retries):
     def decorator(func):
         assert asyncio.iscoroutinefunction(func), "retry only supports coroutine functions currently"
@@ -688,6 +688,12 @@ class TestEntityFactoryImpl:
         assert guild_category.parent_id is None
         assert guild_category.is_nsfw is None
 
+    def test_deserialize_guild_category_without_permission_overwrites(self, entity_factory_impl):
+        guild_category = entity_factory_impl.deserialize_guild_category(
+            {"id": "123", "name": "Test", "position": 3, "type": 4, "guild_id": "123123"}
+        )
+        assert guild_category.permission_overwrites == {}
+
     def test_deserialize_guild_category_with_null_fields(self, entity_factory_impl, permission_overwrite_payload):
         guild_category = entity_factory_impl.deserialize_guild_category(
             {
@@ -703,6 +709,15 @@ class TestEntityFactoryImpl:
         )
         assert guild_category.parent_id is None
 
+    def test_deserialize_guild_category_interns_name(self, entity_factory_impl, guild_category_payload):
+        guild_category_payload["name"] = "".join(("gen", "eral"))
+        other_payload = dict(guild_category_payload, name="".join(("gene", "ral")))
+
+        guild_category = entity_factory_impl.deserialize_guild_category(guild_category_payload)
+        other_guild_category = entity_factory_impl.deserialize_guild_category(other_payload)
+
+        assert guild_category.name is other_guild_category.name
+
     @pytest.fixture()
     def guild_text_channel_payload(self, permission_overwrite_payload):
         return {
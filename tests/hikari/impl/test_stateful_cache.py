@@ -23,9 +23,12 @@ import datetime
 import mock
 import pytest
 
+from hikari import channels
 from hikari import emojis
 from hikari import guilds
 from hikari import invites
+from hikari import messages
+from hikari import presences
 from hikari import snowflakes
 from hikari import traits
 from hikari import users
@@ -44,7 +47,7 @@ class TestStatefulCacheImpl:
     @pytest.fixture()
     def cache_impl(self, app_impl) -> stateful_cache.StatefulCacheImpl:
         return hikari_test_helpers.mock_class_namespace(stateful_cache.StatefulCacheImpl, slots_=False)(
-            app=app_impl, intents=None
+            app=app_impl, intents=None, max_messages=300
         )
 
     def test__build_emoji(self, cache_impl):
@@ -333,6 +336,30 @@ class TestStatefulCacheImpl:
         cache_impl._build_emoji.assert_called_once_with(mock_emoji_data)
         cache_impl._garbage_collect_user.assert_not_called()
 
+    def test_delete_emoji_when_still_referenced(self, cache_impl):
+        mock_emoji_data = mock.Mock(
+            cache.KnownCustomEmojiData,
+            user_id=snowflakes.Snowflake(54123),
+            guild_id=snowflakes.Snowflake(123333),
+            ref_count=1,
+        )
+        emoji_ids = collections.SnowflakeSet()
+        emoji_ids.add_all([snowflakes.Snowflake(12354123), snowflakes.Snowflake(432123)])
+        cache_impl._emoji_entries = collections.FreezableDict({snowflakes.Snowflake(12354123): mock_emoji_data})
+        cache_impl._guild_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(123333): cache.GuildRecord(emojis=emoji_ids)}
+        )
+        cache_impl._garbage_collect_user = mock.Mock()
+        cache_impl._build_emoji = mock.Mock()
+
+        assert cache_impl.delete_emoji(snowflakes.Snowflake(12354123)) is None
+
+        assert mock_emoji_data.has_been_deleted is True
+        assert cache_impl._emoji_entries == {snowflakes.Snowflake(12354123): mock_emoji_data}
+        assert cache_impl._guild_entries[snowflakes.Snowflake(123333)].emojis == {snowflakes.Snowflake(432123)}
+        cache_impl._build_emoji.assert_not_called()
+        cache_impl._garbage_collect_user.assert_not_called()
+
     def test_delete_emoji_for_unknown_emoji(self, cache_impl):
         cache_impl._garbage_collect_user = mock.Mock()
         cache_impl._build_emoji = mock.Mock()
@@ -495,14 +522,110 @@ class TestStatefulCacheImpl:
             is_available=False,
         )
         cache_impl._emoji_entries = collections.FreezableDict(
-            {snowflakes.Snowflake(5123123): mock.Mock(cache.KnownCustomEmojiData)}
+            {snowflakes.Snowflake(5123123): mock.Mock(cache.KnownCustomEmojiData, user_id=snowflakes.Snowflake(654234))}
         )
         cache_impl.set_user = mock.Mock()
         cache_impl._increment_user_ref_count = mock.Mock()
+        cache_impl._garbage_collect_user = mock.Mock()
         assert cache_impl.set_emoji(emoji) is None
         assert 5123123 in cache_impl._emoji_entries
         cache_impl.set_user.assert_called_once_with(mock_user)
         cache_impl._increment_user_ref_count.assert_not_called()
+        cache_impl._garbage_collect_user.assert_not_called()
+
+    def test_set_emoji_when_cached_emoji_loses_user(self, cache_impl):
+        mock_user = mock.Mock(users.User, id=snowflakes.Snowflake(77))
+        cache_impl.set_emoji(
+            emojis.KnownCustomEmoji(
+                app=cache_impl._app,
+                id=snowflakes.Snowflake(5),
+                name="A name",
+                guild_id=snowflakes.Snowflake(65234),
+                role_ids=[],
+                user=mock_user,
+                is_animated=False,
+                is_colons_required=True,
+                is_managed=False,
+                is_available=True,
+            )
+        )
+        assert cache_impl._user_entries[snowflakes.Snowflake(77)].ref_count == 1
+
+        cache_impl.set_emoji(
+            emojis.KnownCustomEmoji(
+                app=cache_impl._app,
+                id=snowflakes.Snowflake(5),
+                name="A name",
+                guild_id=snowflakes.Snowflake(65234),
+                role_ids=[],
+                user=None,
+                is_animated=False,
+                is_colons_required=True,
+                is_managed=False,
+                is_available=True,
+            )
+        )
+
+        assert 77 not in cache_impl._user_entries
+        assert cache_impl._emoji_entries[snowflakes.Snowflake(5)].user_id is None
+        assert cache_impl.get_emoji(snowflakes.Snowflake(5)).user is None
+
+    def test_set_emoji_when_cached_emoji_gains_user(self, cache_impl):
+        mock_user = mock.Mock(users.User, id=snowflakes.Snowflake(77))
+        cache_impl.set_emoji(
+            emojis.KnownCustomEmoji(
+                app=cache_impl._app,
+                id=snowflakes.Snowflake(5),
+                name="A name",
+                guild_id=snowflakes.Snowflake(65234),
+                role_ids=[],
+                user=None,
+                is_animated=False,
+                is_colons_required=True,
+                is_managed=False,
+                is_available=True,
+            )
+        )
+
+        cache_impl.set_emoji(
+            emojis.KnownCustomEmoji(
+                app=cache_impl._app,
+                id=snowflakes.Snowflake(5),
+                name="A name",
+                guild_id=snowflakes.Snowflake(65234),
+                role_ids=[],
+                user=mock_user,
+                is_animated=False,
+                is_colons_required=True,
+                is_managed=False,
+                is_available=True,
+            )
+        )
+
+        assert cache_impl._user_entries[snowflakes.Snowflake(77)].ref_count == 1
+        assert cache_impl.get_emoji(snowflakes.Snowflake(5)).user.id == 77
+
+    def test_set_emoji_when_cached_emoji_changes_user(self, cache_impl):
+        mock_old_user = mock.Mock(users.User, id=snowflakes.Snowflake(77))
+        mock_new_user = mock.Mock(users.User, id=snowflakes.Snowflake(88))
+        for user in (mock_old_user, mock_new_user):
+            cache_impl.set_emoji(
+                emojis.KnownCustomEmoji(
+                    app=cache_impl._app,
+                    id=snowflakes.Snowflake(5),
+                    name="A name",
+                    guild_id=snowflakes.Snowflake(65234),
+                    role_ids=[],
+                    user=user,
+                    is_animated=False,
+                    is_colons_required=True,
+                    is_managed=False,
+                    is_available=True,
+                )
+            )
+
+        assert 77 not in cache_impl._user_entries
+        assert cache_impl._user_entries[snowflakes.Snowflake(88)].ref_count == 1
 
     def test_update_emoji(self, cache_impl):
         mock_cached_emoji_1 = mock.Mock(emojis.KnownCustomEmoji)
@@ -516,6 +639,43 @@ class TestStatefulCacheImpl:
         )
         cache_impl.set_emoji.assert_called_once_with(mock_emoji)
 
+    def test__remove_guild_record_if_empty_when_empty(self, cache_impl):
+        cache_impl._guild_entries = collections.FreezableDict({snowflakes.Snowflake(423123): cache.GuildRecord()})
+
+        cache_impl._remove_guild_record_if_empty(snowflakes.Snowflake(423123))
+
+        assert cache_impl._guild_entries == {}
+
+    def test__remove_guild_record_if_empty_when_not_empty(self, cache_impl):
+        guild_record = cache.GuildRecord(roles=collections.SnowflakeSet(54123))
+        cache_impl._guild_entries = collections.FreezableDict({snowflakes.Snowflake(423123): guild_record})
+
+        cache_impl._remove_guild_record_if_empty(snowflakes.Snowflake(423123))
+
+        assert cache_impl._guild_entries == {snowflakes.Snowflake(423123): guild_record}
+
+    def test__remove_guild_record_if_empty_when_not_found(self, cache_impl):
+        cache_impl._guild_entries = collections.FreezableDict({})
+
+        cache_impl._remove_guild_record_if_empty(snowflakes.Snowflake(423123))
+
+        assert cache_impl._guild_entries == {}
+
+    def test__get_or_create_guild_record_for_known_guild(self, cache_impl):
+        guild_record = cache.GuildRecord(is_available=True)
+        cache_impl._guild_entries = collections.FreezableDict({snowflakes.Snowflake(423123): guild_record})
+
+        assert cache_impl._get_or_create_guild_record(snowflakes.Snowflake(423123)) is guild_record
+
+    def test__get_or_create_guild_record_for_unknown_guild(self, cache_impl):
+        cache_impl._guild_entries = collections.FreezableDict({})
+
+        guild_record = cache_impl._get_or_create_guild_record(snowflakes.Snowflake(423123))
+
+        assert guild_record == cache.GuildRecord()
+        assert cache_impl._guild_entries == {snowflakes.Snowflake(423123): guild_record}
+        assert cache_impl._guild_entries[snowflakes.Snowflake(423123)] is guild_record
+
     def test_clear_guilds_when_no_guilds_cached(self, cache_impl):
         cache_impl._guild_entries = collections.FreezableDict(
             {
@@ -625,6 +785,13 @@ class TestStatefulCacheImpl:
         assert cached_guild == mock_guild
         assert cache_impl is not mock_guild
 
+    def test_get_guild_for_unknown_guild(self, cache_impl):
+        cache_impl._guild_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(543123): cache.GuildRecord(is_available=True)}
+        )
+        assert cache_impl.get_guild(snowflakes.Snowflake(543123)) is None
+        assert cache_impl.get_guild(snowflakes.Snowflake(54234123)) is None
+
     def test_get_available_guild_for_known_guild_when_available(self, cache_impl):
         mock_guild = mock.MagicMock(guilds.GatewayGuild)
         cache_impl._guild_entries = collections.FreezableDict(
@@ -778,9 +945,35 @@ class TestStatefulCacheImpl:
         assert cache_impl.set_guild_availability(snowflakes.Snowflake(452234123), True) is None
         assert 452234123 not in cache_impl._guild_entries
 
-    @pytest.mark.skip(reason="TODO")
     def test_update_guild(self, cache_impl):
-        ...
+        mock_old_guild = mock.MagicMock(guilds.GatewayGuild, member_count=42, joined_at=object(), is_large=True)
+        mock_guild = mock.MagicMock(guilds.GatewayGuild, id=snowflakes.Snowflake(43123), member_count=None)
+        cache_impl._guild_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(43123): cache.GuildRecord(guild=mock_old_guild, is_available=False)}
+        )
+
+        old, new = cache_impl.update_guild(mock_guild)
+
+        guild_record = cache_impl._guild_entries[snowflakes.Snowflake(43123)]
+        assert old is mock_old_guild
+        assert new is guild_record.guild
+        assert new is not mock_guild
+        assert new.member_count == 42
+        assert new.joined_at is mock_old_guild.joined_at
+        assert new.is_large is True
+        assert guild_record.is_available is True
+
+    def test_update_guild_for_uncached_guild(self, cache_impl):
+        mock_guild = mock.MagicMock(guilds.GatewayGuild, id=snowflakes.Snowflake(43123), member_count=54)
+
+        old, new = cache_impl.update_guild(mock_guild)
+
+        guild_record = cache_impl._guild_entries[snowflakes.Snowflake(43123)]
+        assert old is None
+        assert new is guild_record.guild
+        assert new is not mock_guild
+        assert new.member_count == 54
+        assert guild_record.is_available is True
 
     @pytest.mark.skip(reason="TODO")
     def test_clear_guild_channels(self, cache_impl):
@@ -802,17 +995,123 @@ class TestStatefulCacheImpl:
     def test_get_guild_channels_view(self, cache_impl):
         ...
 
-    @pytest.mark.skip(reason="TODO")
     def test_get_guild_channels_view_for_guild(self, cache_impl):
-        ...
+        mock_category = mock.Mock(
+            channels.GuildCategory, type=channels.ChannelType.GUILD_CATEGORY, position=1, parent_id=None
+        )
+        mock_other_category = mock.Mock(
+            channels.GuildCategory, type=channels.ChannelType.GUILD_CATEGORY, position=0, parent_id=None
+        )
+        mock_text_channel = mock.Mock(
+            channels.GuildTextChannel,
+            type=channels.ChannelType.GUILD_TEXT,
+            position=1,
+            parent_id=snowflakes.Snowflake(1),
+        )
+        mock_voice_channel = mock.Mock(
+            channels.GuildVoiceChannel,
+            type=channels.ChannelType.GUILD_VOICE,
+            position=0,
+            parent_id=snowflakes.Snowflake(1),
+        )
+        mock_other_text_channel = mock.Mock(
+            channels.GuildTextChannel,
+            type=channels.ChannelType.GUILD_TEXT,
+            position=0,
+            parent_id=snowflakes.Snowflake(1),
+        )
+        mock_orphan_channel = mock.Mock(
+            channels.GuildTextChannel, type=channels.ChannelType.GUILD_TEXT, position=5, parent_id=None
+        )
+        cache_impl._guild_channel_entries = collections.FreezableDict(
+            {
+                snowflakes.Snowflake(1): mock_category,
+                snowflakes.Snowflake(2): mock_other_category,
+                snowflakes.Snowflake(3): mock_text_channel,
+                snowflakes.Snowflake(4): mock_voice_channel,
+                snowflakes.Snowflake(5): mock_other_text_channel,
+                snowflakes.Snowflake(6): mock_orphan_channel,
+                snowflakes.Snowflake(7): mock.Mock(channels.GuildTextChannel),
+            }
+        )
+        cache_impl._guild_entries = collections.FreezableDict(
+            {
+                snowflakes.Snowflake(54234): cache.GuildRecord(
+                    channels=collections.SnowflakeSet(1, 2, 3, 4, 5, 6),
+                )
+            }
+        )
+
+        with mock.patch.object(cache, "copy_guild_channel", side_effect=lambda channel: channel):
+            result = cache_impl.get_guild_channels_view_for_guild(snowflakes.Snowflake(54234))
+
+            assert list(result.keys()) == [6, 2, 1, 5, 3, 4]
+            assert list(result.values()) == [
+                mock_orphan_channel,
+                mock_other_category,
+                mock_category,
+                mock_other_text_channel,
+                mock_text_channel,
+                mock_voice_channel,
+            ]
+
+    def test_get_guild_channels_view_for_guild_when_parent_not_cached(self, cache_impl):
+        mock_channel = mock.Mock(
+            channels.GuildTextChannel,
+            type=channels.ChannelType.GUILD_TEXT,
+            position=2,
+            parent_id=snowflakes.Snowflake(9999),
+        )
+        mock_other_channel = mock.Mock(
+            channels.GuildTextChannel, type=channels.ChannelType.GUILD_TEXT, position=1, parent_id=None
+        )
+        cache_impl._guild_channel_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(1): mock_channel, snowflakes.Snowflake(2): mock_other_channel}
+        )
+        cache_impl._guild_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(54234): cache.GuildRecord(channels=collections.SnowflakeSet(1, 2))}
+        )
+
+        with mock.patch.object(cache, "copy_guild_channel", side_effect=lambda channel: channel):
+            result = cache_impl.get_guild_channels_view_for_guild(snowflakes.Snowflake(54234))
+
+            assert list(result.values()) == [mock_other_channel, mock_channel]
+
+    def test_get_guild_channels_view_for_guild_for_unknown_guild(self, cache_impl):
+        cache_impl._guild_entries = collections.FreezableDict({})
+
+        result = cache_impl.get_guild_channels_view_for_guild(snowflakes.Snowflake(54234))
+
+        assert result == {}
 
     @pytest.mark.skip(reason="TODO")
     def test_set_guild_channel(self, cache_impl):
         ...
 
-    @pytest.mark.skip(reason="TODO")
     def test_update_guild_channel(self, cache_impl):
-        ...
+        mock_old_channel = mock.Mock(channels.GuildTextChannel)
+        mock_new_channel = mock.Mock(channels.GuildTextChannel)
+        mock_channel = mock.Mock(channels.GuildTextChannel, id=snowflakes.Snowflake(123123))
+        cache_impl._guild_channel_entries = collections.FreezableDict({snowflakes.Snowflake(123123): mock_old_channel})
+        cache_impl.set_guild_channel = mock.Mock()
+        cache_impl.get_guild_channel = mock.Mock(return_value=mock_new_channel)
+
+        result = cache_impl.update_guild_channel(mock_channel)
+
+        assert result == (mock_old_channel, mock_new_channel)
+        cache_impl.set_guild_channel.assert_called_once_with(mock_channel)
+        cache_impl.get_guild_channel.assert_called_once_with(snowflakes.Snowflake(123123))
+
+    def test_update_guild_channel_for_uncached_channel(self, cache_impl):
+        mock_new_channel = mock.Mock(channels.GuildTextChannel)
+        mock_channel = mock.Mock(channels.GuildTextChannel, id=snowflakes.Snowflake(123123))
+        cache_impl.set_guild_channel = mock.Mock()
+        cache_impl.get_guild_channel = mock.Mock(return_value=mock_new_channel)
+
+        result = cache_impl.update_guild_channel(mock_channel)
+
+        assert result == (None, mock_new_channel)
+        cache_impl.set_guild_channel.assert_called_once_with(mock_channel)
 
     def test__build_invite(self, cache_impl):
         invite_data = cache.InviteData(
@@ -1982,9 +2281,43 @@ class TestStatefulCacheImpl:
     def test_get_presences_view_for_guild(self, cache_impl):
         ...
 
-    @pytest.mark.skip(reason="TODO")
     def test_set_presence(self, cache_impl):
-        ...
+        known_emoji = emojis.CustomEmoji(id=snowflakes.Snowflake(1), name="known", is_animated=False)
+        unknown_emoji = emojis.CustomEmoji(id=snowflakes.Snowflake(2), name="unknown", is_animated=False)
+        new_emoji = emojis.CustomEmoji(id=snowflakes.Snowflake(3), name="new", is_animated=False)
+        mock_presence = mock.Mock(
+            presences.MemberPresence,
+            user_id=snowflakes.Snowflake(4123),
+            guild_id=snowflakes.Snowflake(5123),
+            activities=[
+                mock.Mock(presences.RichActivity, emoji=known_emoji),
+                mock.Mock(presences.RichActivity, emoji=unknown_emoji),
+                mock.Mock(presences.RichActivity, emoji=new_emoji),
+                mock.Mock(presences.RichActivity, emoji=emojis.UnicodeEmoji("\N{OK HAND SIGN}")),
+                mock.Mock(presences.RichActivity, emoji=None),
+            ],
+        )
+        known_emoji_data = mock.Mock(cache.KnownCustomEmojiData, ref_count=1)
+        unknown_emoji_data = cache.GenericRefWrapper(object=mock.Mock(emojis.CustomEmoji), ref_count=2)
+        cache_impl._emoji_entries = collections.FreezableDict({snowflakes.Snowflake(1): known_emoji_data})
+        cache_impl._unknown_custom_emoji_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(2): unknown_emoji_data}
+        )
+        mock_presence_data = mock.Mock(cache.MemberPresenceData)
+
+        with mock.patch.object(cache.MemberPresenceData, "build_from_entity", return_value=mock_presence_data):
+            cache_impl.set_presence(mock_presence)
+
+        assert known_emoji_data.ref_count == 2
+        assert unknown_emoji_data.ref_count == 3
+        assert unknown_emoji_data.object == unknown_emoji
+        assert unknown_emoji_data.object is not unknown_emoji
+        new_emoji_data = cache_impl._unknown_custom_emoji_entries[snowflakes.Snowflake(3)]
+        assert new_emoji_data.ref_count == 1
+        assert new_emoji_data.object == new_emoji
+        assert cache_impl._guild_entries[snowflakes.Snowflake(5123)].presences == {
+            snowflakes.Snowflake(4123): mock_presence_data
+        }
 
     @pytest.mark.skip(reason="TODO")
     def test_update_presence(self, cache_impl):
@@ -2097,6 +2430,12 @@ class TestStatefulCacheImpl:
         cache_impl._build_user = mock.Mock(return_value=mock_user)
         assert cache_impl.get_user(snowflakes.Snowflake(21231234)) == mock_user
 
+    def test_get_user_for_unknown_user(self, cache_impl):
+        cache_impl._user_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(645234): mock.Mock(cache.GenericRefWrapper)}
+        )
+        assert cache_impl.get_user(snowflakes.Snowflake(21231234)) is None
+
     def test_get_users_view_for_filled_user_cache(self, cache_impl):
         mock_user_1 = mock.MagicMock(users.User)
         mock_user_2 = mock.MagicMock(users.User)
@@ -2114,6 +2453,30 @@ class TestStatefulCacheImpl:
     def test_get_users_view_for_empty_user_cache(self, cache_impl):
         assert cache_impl.get_users_view() == {}
 
+    def test__garbage_collect_user_with_decrement(self, cache_impl):
+        wrapped_user = cache.GenericRefWrapper(object=mock.Mock(users.User), ref_count=3)
+        cache_impl._user_entries = collections.FreezableDict({snowflakes.Snowflake(54123): wrapped_user})
+
+        cache_impl._garbage_collect_user(snowflakes.Snowflake(54123), decrement=2)
+
+        assert cache_impl._user_entries == {snowflakes.Snowflake(54123): wrapped_user}
+        assert wrapped_user.ref_count == 1
+
+    def test__garbage_collect_user_removes_unreferenced_user(self, cache_impl):
+        wrapped_user = cache.GenericRefWrapper(object=mock.Mock(users.User), ref_count=1)
+        cache_impl._user_entries = collections.FreezableDict({snowflakes.Snowflake(54123): wrapped_user})
+
+        cache_impl._garbage_collect_user(snowflakes.Snowflake(54123), decrement=1)
+
+        assert cache_impl._user_entries == {}
+
+    def test__garbage_collect_user_for_unknown_user(self, cache_impl):
+        cache_impl._user_entries = collections.FreezableDict({})
+
+        cache_impl._garbage_collect_user(snowflakes.Snowflake(54123), decrement=1)
+
+        assert cache_impl._user_entries == {}
+
     def test_set_user(self, cache_impl):
         mock_user = mock.MagicMock(users.User, id=snowflakes.Snowflake(6451234123))
         cache_impl._user_entries = collections.FreezableDict(
@@ -2473,3 +2836,106 @@ class TestStatefulCacheImpl:
                 mock.call(snowflakes.Snowflake(43123123), snowflakes.Snowflake(542134)),
             ]
         )
+
+    def test_delete_message(self, cache_impl):
+        mock_message = mock.Mock(messages.PartialMessage)
+        mock_other_message = mock.Mock(messages.PartialMessage)
+        cache_impl._message_entries = collections.LimitedCapacityCacheMap(
+            {snowflakes.Snowflake(32123): mock_message, snowflakes.Snowflake(54234): mock_other_message}, limit=300
+        )
+
+        cache_impl.delete_message(snowflakes.Snowflake(32123))
+
+        assert cache_impl._message_entries == {snowflakes.Snowflake(54234): mock_other_message}
+
+    def test_delete_message_for_unknown_message(self, cache_impl):
+        mock_message = mock.Mock(messages.PartialMessage)
+        cache_impl._message_entries = collections.LimitedCapacityCacheMap(
+            {snowflakes.Snowflake(54234): mock_message}, limit=300
+        )
+
+        cache_impl.delete_message(snowflakes.Snowflake(32123))
+
+        assert cache_impl._message_entries == {snowflakes.Snowflake(54234): mock_message}
+
+    def test_delete_messages(self, cache_impl):
+        mock_message = mock.Mock(messages.PartialMessage)
+        cache_impl._message_entries = collections.LimitedCapacityCacheMap(
+            {
+                snowflakes.Snowflake(32123): mock.Mock(messages.PartialMessage),
+                snowflakes.Snowflake(54234): mock_message,
+                snowflakes.Snowflake(65234): mock.Mock(messages.PartialMessage),
+            },
+            limit=300,
+        )
+
+        cache_impl.delete_messages(
+            [snowflakes.Snowflake(32123), snowflakes.Snowflake(65234), snowflakes.Snowflake(76345)]
+        )
+
+        assert cache_impl._message_entries == {snowflakes.Snowflake(54234): mock_message}
+
+    def test_get_message(self, cache_impl):
+        mock_message = mock.Mock(messages.PartialMessage)
+        cache_impl._message_entries = collections.LimitedCapacityCacheMap(
+            {snowflakes.Snowflake(32123): mock_message}, limit=300
+        )
+
+        assert cache_impl.get_message(snowflakes.Snowflake(32123)) is mock_message
+
+    def test_get_message_for_unknown_message(self, cache_impl):
+        assert cache_impl.get_message(snowflakes.Snowflake(32123)) is None
+
+    def test_set_message(self, cache_impl):
+        mock_message = mock.Mock(messages.PartialMessage, id=snowflakes.Snowflake(32123))
+
+        cache_impl.set_message(mock_message)
+
+        assert cache_impl._message_entries == {snowflakes.Snowflake(32123): mock_message}
+
+    def test_set_message_drops_oldest_message_when_full(self, app_impl):
+        cache_impl = stateful_cache.StatefulCacheImpl(app=app_impl, intents=None, max_messages=2)
+        mock_message_1 = mock.Mock(messages.PartialMessage, id=snowflakes.Snowflake(1))
+        mock_message_2 = mock.Mock(messages.PartialMessage, id=snowflakes.Snowflake(2))
+        mock_message_3 = mock.Mock(messages.PartialMessage, id=snowflakes.Snowflake(3))
+
+        cache_impl.set_message(mock_message_1)
+        cache_impl.set_message(mock_message_2)
+        cache_impl.set_message(mock_message_3)
+
+        assert cache_impl._message_entries == {
+            snowflakes.Snowflake(2): mock_message_2,
+            snowflakes.Snowflake(3): mock_message_3,
+        }
+
+    def test_max_messages(self, app_impl):
+        cache_impl = stateful_cache.StatefulCacheImpl(app=app_impl, intents=None, max_messages=2)
+
+        assert cache_impl.max_messages == 2
+
+    def test_max_messages_setter(self, app_impl):
+        cache_impl = stateful_cache.StatefulCacheImpl(app=app_impl, intents=None, max_messages=3)
+        mock_messages = [mock.Mock(messages.PartialMessage, id=snowflakes.Snowflake(i)) for i in range(3)]
+        for mock_message in mock_messages:
+            cache_impl.set_message(mock_message)
+
+        cache_impl.max_messages = 1
+        cache_impl.set_message(mock_messages[0])
+
+        assert cache_impl.max_messages == 1
+        assert cache_impl._message_entries == {snowflakes.Snowflake(0): mock_messages[0]}
+
+    def test_set_message_for_already_cached_message_when_full(self, app_impl):
+        cache_impl = stateful_cache.StatefulCacheImpl(app=app_impl, intents=None, max_messages=2)
+        mock_message_1 = mock.Mock(messages.PartialMessage, id=snowflakes.Snowflake(1))
+        mock_message_2 = mock.Mock(messages.PartialMessage, id=snowflakes.Snowflake(2))
+        mock_new_message_2 = mock.Mock(messages.PartialMessage, id=snowflakes.Snowflake(2))
+
+        cache_impl.set_message(mock_message_1)
+        cache_impl.set_message(mock_message_2)
+        cache_impl.set_message(mock_new_message_2)
+
+        assert cache_impl._message_entries == {
+            snowflakes.Snowflake(1): mock_message_1,
+            snowflakes.Snowflake(2): mock_new_message_2,
+        }
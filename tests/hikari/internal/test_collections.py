@@ -293,6 +293,54 @@ class TestLimitedCapacityCacheMap:
         mock_map.update({"shinji": "ikari"})
         assert mock_map == {"pacify": "me", "qt": "pie", "eva": "Rei", "shinji": "ikari"}
 
+    def test_limit(self):
+        assert collections.LimitedCapacityCacheMap(limit=42).limit == 42
+
+    def test_limit_setter_drops_oldest_entries(self):
+        mock_map = collections.LimitedCapacityCacheMap({"o": "n", "b": "a", "a": "v"}, limit=5)
+
+        mock_map.limit = 2
+
+        assert mock_map.limit == 2
+        assert mock_map == {"b": "a", "a": "v"}
+
+
+@pytest.mark.parametrize(
+    ("cls", "kwargs"), [(collections.FreezableDict, {}), (collections.LimitedCapacityCacheMap, {"limit": 50})]
+)
+class TestDictBackedMapping:
+    def test___contains__(self, cls, kwargs):
+        mock_map = cls({"hmm": "forearm", "cat": "bag"}, **kwargs)
+
+        assert "cat" in mock_map
+        assert "bye" not in mock_map
+
+    def test_get(self, cls, kwargs):
+        mock_map = cls({"hmm": "forearm", "cat": "bag"}, **kwargs)
+
+        assert mock_map.get("cat") == "bag"
+        assert mock_map.get("bye") is None
+        assert mock_map.get("bye", "default") == "default"
+
+    def test_pop(self, cls, kwargs):
+        mock_map = cls({"hmm": "forearm", "cat": "bag"}, **kwargs)
+
+        assert mock_map.pop("cat") == "bag"
+        assert mock_map == {"hmm": "forearm"}
+
+    def test_pop_with_default(self, cls, kwargs):
+        mock_map = cls({"hmm": "forearm", "cat": "bag"}, **kwargs)
+
+        assert mock_map.pop("bye", None) is None
+        assert mock_map.pop("hmm", None) == "forearm"
+        assert mock_map == {"cat": "bag"}
+
+    def test_pop_for_unknown_key(self, cls, kwargs):
+        mock_map = cls({"hmm": "forearm"}, **kwargs)
+
+        with pytest.raises(KeyError):
+            mock_map.pop("bye")
+
 
 class TestSnowflakeSet:
     def test_init_creates_empty_array(self):
@@ -37,6 +37,22 @@ def mock_app():
     return mock.Mock(spec_set=bot.BotApp)
 
 
+@pytest.mark.parametrize(
+    "cls",
+    [
+        channels.DMChannel,
+        channels.GroupDMChannel,
+        channels.GuildCategory,
+        channels.GuildTextChannel,
+        channels.GuildNewsChannel,
+        channels.GuildStoreChannel,
+        channels.GuildVoiceChannel,
+    ],
+)
+def test_channel_classes_are_fully_slotted(cls):
+    hikari_test_helpers.assert_fully_slotted(cls)
+
+
 class TestChannelType:
     def test_str_operator(self):
         channel_type = channels.ChannelType(1)
@@ -22,6 +22,12 @@ import pytest
 
 from hikari import emojis
 from hikari import snowflakes
+from tests.hikari import hikari_test_helpers
+
+
+@pytest.mark.parametrize("cls", [emojis.UnicodeEmoji, emojis.CustomEmoji, emojis.KnownCustomEmoji])
+def test_emoji_classes_are_fully_slotted(cls):
+    hikari_test_helpers.assert_fully_slotted(cls)
 
 
 class TestEmoji:
@@ -34,6 +34,11 @@ from hikari.internal import routes
 from tests.hikari import hikari_test_helpers
 
 
+@pytest.mark.parametrize("cls", [guilds.Member, guilds.Role, guilds.GatewayGuild, guilds.RESTGuild])
+def test_guild_classes_are_fully_slotted(cls):
+    hikari_test_helpers.assert_fully_slotted(cls)
+
+
 @pytest.fixture()
 def mock_app():
     return mock.Mock(spec_set=bot.BotApp)
@@ -285,6 +290,27 @@ class TestMember:
 
         model.app.cache.get_roles_view_for_guild.assert_called_once_with(456)
 
+    def test_top_role_when_highest_role_is_last_in_view(self, model):
+        role1 = mock.Mock(id=321, position=1)
+        role2 = mock.Mock(id=654, position=3)
+        role3 = mock.Mock(id=987, position=2)
+        role4 = mock.Mock(id=111, position=10)
+        mock_cache_view = {321: role1, 987: role3, 111: role4, 654: role2}
+        model.app.cache.get_roles_view_for_guild.return_value = mock_cache_view
+        model.role_ids = [987, 321, 654]
+
+        assert model.top_role is role2
+
+    def test_top_role_when_positions_tie_returns_first_role_in_view(self, model):
+        role1 = mock.Mock(id=321, position=2)
+        role2 = mock.Mock(id=654, position=2)
+        role3 = mock.Mock(id=987, position=1)
+        mock_cache_view = {654: role2, 321: role1, 987: role3}
+        model.app.cache.get_roles_view_for_guild.return_value = mock_cache_view
+        model.role_ids = [321, 654, 987]
+
+        assert model.top_role is role2
+
 
 class TestPartialGuild:
     @pytest.fixture()
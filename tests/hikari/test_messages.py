@@ -30,6 +30,12 @@ from hikari import snowflakes
 from hikari import urls
 from hikari import users
 from hikari.internal import routes
+from tests.hikari import hikari_test_helpers
+
+
+@pytest.mark.parametrize("cls", [messages.PartialMessage, messages.Message])
+def test_message_classes_are_fully_slotted(cls):
+    hikari_test_helpers.assert_fully_slotted(cls)
 
 
 class TestMessageType:
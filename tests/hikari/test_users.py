@@ -29,6 +29,11 @@ from hikari.internal import routes
 from tests.hikari import hikari_test_helpers
 
 
+@pytest.mark.parametrize("cls", [users.UserImpl, users.OwnUser])
+def test_user_classes_are_fully_slotted(cls):
+    hikari_test_helpers.assert_fully_slotted(cls)
+
+
 class TestUserFlag:
     def test_str_operator(self):
         flag = users.UserFlag(1 << 17)